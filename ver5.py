@@ -1,22 +1,33 @@
-import pdfplumber
-import spacy
-import matplotlib.pyplot as plt
-import seaborn as sns
-from collections import Counter
-import re
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import inch
+import pymupdf
+import ahocorasick
+import numpy as np
+import hashlib
+import io
+import logging
+import multiprocessing
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from joblib import Memory
 
-# Load a pretrained NLP model (for English)
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print("Downloading 'en_core_web_sm' model...")
-    from spacy.cli import download
-    download("en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
+logger = logging.getLogger(__name__)
+
+# On-disk cache of analysis results, so re-running on an unchanged PDF skips extraction and analysis
+memory = Memory(".rescache", verbose=0)
+
+# Documents with at least this many pages are extracted in parallel; below it,
+# process start-up costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 50
+PAGE_WORKERS = 4
+
+# Batches of at least this many resumes (PDFs in main, texts in analyze_resumes) are
+# analyzed across worker processes, handed out in chunks so each task amortizes the
+# inter-process round trip; smaller batches run in-process
+PARALLEL_RESUME_THRESHOLD = 100
+RESUME_CHUNK_SIZE = 32
+
+# Bump whenever the chart drawing code, figure size or DPI changes, so stale images are redrawn
+CHART_VERSION = 1
 
 # Define skill sets for various job profiles
 job_profiles = {
@@ -30,44 +41,112 @@ job_profiles = {
     "Cybersecurity Analyst": ["Networking", "Firewalls", "Penetration Testing", "Cryptography", "Linux", "SIEM"]
 }
 
+# Lowercased skill constants, computed once instead of on every call
+lower_profiles = {profile: [skill.lower() for skill in skills] for profile, skills in job_profiles.items()}
+all_skills_lower = frozenset(skill for skills in lower_profiles.values() for skill in skills)
+required_skill_pairs = {profile: list(zip(skills, lower_profiles[profile])) for profile, skills in job_profiles.items()}
+lowercase_skills = {skill: skill_lower for pairs in required_skill_pairs.values() for skill, skill_lower in pairs}
+
+# Keywords that mark a sentence as belonging to a resume section
+section_keywords = {"education": "education", "experience": "experience", "work": "experience"}
+
+# Fingerprint of everything the cached analysis depends on besides the PDF itself.
+# Bump ANALYSIS_LOGIC_VERSION whenever extraction or scoring code changes.
+ANALYSIS_LOGIC_VERSION = 2
+ANALYSIS_VERSION = hashlib.sha1(repr((ANALYSIS_LOGIC_VERSION, job_profiles, section_keywords)).encode()).hexdigest()
+
+# Aho-Corasick automaton over every skill phrase and section keyword, so a single
+# pass over the text finds all of them at once (including multi-word skills like
+# "Machine Learning"). Values are (kind, match length, name).
+keyword_automaton = ahocorasick.Automaton()
+for skill, skill_lower in lowercase_skills.items():
+    keyword_automaton.add_word(skill_lower, ("skill", len(skill_lower), skill))
+for keyword, section in section_keywords.items():
+    keyword_automaton.add_word(keyword, ("section", len(keyword), section))
+keyword_automaton.make_automaton()
+
+# Profile x skill incidence matrix, so scoring every profile is a single matrix-vector product
+profile_names = list(job_profiles)
+skill_index = {skill: i for i, skill in enumerate(sorted(all_skills_lower))}
+profile_skill_matrix = np.zeros((len(profile_names), len(skill_index)), dtype=np.int8)
+for row, required_skills in enumerate(lower_profiles.values()):
+    for skill in required_skills:
+        profile_skill_matrix[row, skill_index[skill]] = 1
+
+def extract_page_range(pdf_path, start, stop):
+    """Extracts the text of pages [start, stop) of a PDF file."""
+    with pymupdf.open(pdf_path) as pdf:
+        return [pdf[number].get_text(sort=True) for number in range(start, stop)]
+
 def extract_text_from_pdf(pdf_path):
     """Extracts text from a PDF file."""
-    with pdfplumber.open(pdf_path) as pdf:
-        text = ''
-        for page in pdf.pages:
-            text += page.extract_text() or ''  # Handle pages without text
-    print("Extracted Text:\n", text)  # Debugging line to show extracted text
+    with pymupdf.open(pdf_path) as pdf:
+        page_count = pdf.page_count
+        # Inside a batch worker the CPUs are already busy, so don't start a nested pool
+        parallel = page_count >= PARALLEL_PAGE_THRESHOLD and multiprocessing.parent_process() is None
+        if not parallel:
+            # sort=True emits text in reading order, keeping headings on the same line as their content
+            pages = [page.get_text(sort=True) for page in pdf]
+    
+    if parallel:
+        # PyMuPDF is not thread-safe, so long documents are split into
+        # contiguous page ranges that are extracted in separate processes
+        workers = min(os.cpu_count() or 1, PAGE_WORKERS)
+        starts = [page_count * i // workers for i in range(workers)]
+        stops = starts[1:] + [page_count]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(extract_page_range, [pdf_path] * workers, starts, stops)
+            pages = [page for chunk in chunks for page in chunk]
+    
+    # Scanned pages without a text layer come back blank; leave them out
+    text = "\n".join(page for page in pages if page.strip())
+    logger.debug("Extracted Text:\n%s", text)  # Debugging line to show extracted text
     return text
 
 def extract_entities(text):
     """Extracts entities like skills, experience, education, etc., from resume text."""
-    doc = nlp(text)
-    entities = {"education": [], "experience": [], "skills": []}
-
-    # Education and Experience Extraction
-    for sent in doc.sents:
-        sent_text = sent.text.lower()
-        if "education" in sent_text:
-            entities["education"].append(sent.text.strip())
-        elif "experience" in sent_text or "work" in sent_text:
-            entities["experience"].append(sent.text.strip())
+    entities = {"education": [], "education_lc": [], "experience": [], "skills": []}
+    matched_skills = set()
+
+    # Resumes are line-structured, so each line is treated as one sentence.
+    # A single walk over the lines lowercases each one once and runs one
+    # automaton pass that reports section keywords and skills together.
+    for sent in text.splitlines():
+        sent_text = sent.lower()
+        sections = set()
+        for end, (kind, length, name) in keyword_automaton.iter(sent_text):
+            if kind == "section":
+                sections.add(name)
+                continue
+            # Only accept whole-word skill hits, so "R" doesn't match inside every word
+            start = end - length + 1
+            before = sent_text[start - 1] if start > 0 else " "
+            after = sent_text[end + 1] if end + 1 < len(sent_text) else " "
+            if not (before.isalnum() or after.isalnum()):
+                matched_skills.add(name)
+        
+        # Education and Experience Extraction
+        if "education" in sections:
+            entities["education"].append(sent.strip())
+            entities["education_lc"].append(sent_text)  # Already lowercased for later keyword checks
+        elif "experience" in sections:
+            entities["experience"].append(sent.strip())
     
-    # Skill Extraction - matching with job profile skills
-    found_skills = set(re.findall(r'\b\w+\b', text.lower()))
-    all_skills = set([skill.lower() for skills in job_profiles.values() for skill in skills])
-    matched_skills = list(all_skills.intersection(found_skills))
     entities["skills"].extend(matched_skills)
 
     return entities
 
 def detect_job_profile(candidate_skills):
     """Detects the most suitable job profile for the candidate based on skills."""
-    profile_scores = {profile: 0 for profile in job_profiles.keys()}
+    candidate_vector = np.zeros(len(skill_index), dtype=np.int8)
+    for skill in candidate_skills:
+        if skill in skill_index:
+            candidate_vector[skill_index[skill]] = 1
     
-    for profile, required_skills in job_profiles.items():
-        profile_scores[profile] = sum(1 for skill in required_skills if skill.lower() in candidate_skills)
+    scores = profile_skill_matrix @ candidate_vector
+    profile_scores = dict(zip(profile_names, scores.tolist()))
     
-    best_profile = max(profile_scores, key=profile_scores.get) if any(profile_scores.values()) else None
+    best_profile = profile_names[int(scores.argmax())] if scores.any() else None
     return best_profile, profile_scores
 
 def analyze_resume(text):
@@ -75,78 +154,131 @@ def analyze_resume(text):
     entities = extract_entities(text)
     
     # Flatten skills list and standardize for matching
-    candidate_skills = set(skill.lower() for skill in entities["skills"])
+    candidate_skills = {lowercase_skills[skill] for skill in entities["skills"]}
+    # education_lc is an internal helper, so it is taken out of the returned entities
+    has_bachelor = any("bachelor" in edu for edu in entities.pop("education_lc"))
+    
+    # No skills means no profile can match, so skip scoring altogether
+    if not candidate_skills:
+        strengths = {"skills": [], "education_level": "Bachelor's" if has_bachelor else None}
+        return entities, strengths, {"missing_skills": []}, None, dict.fromkeys(profile_names, 0)
 
     best_profile, profile_scores = detect_job_profile(candidate_skills)
     
     # Identify missing skills for the detected profile
-    required_skills = job_profiles.get(best_profile, [])
-    missing_skills = [skill for skill in required_skills if skill.lower() not in candidate_skills]
+    missing_skills = [skill for skill, skill_lower in required_skill_pairs.get(best_profile, []) if skill_lower not in candidate_skills]
 
     strengths = {
         "skills": list(candidate_skills),
-        "education_level": "Bachelor's" if any("bachelor" in edu.lower() for edu in entities["education"]) else None,
+        "education_level": "Bachelor's" if has_bachelor else None,
     }
     weaknesses = {"missing_skills": missing_skills}
     
     return entities, strengths, weaknesses, best_profile, profile_scores
 
+def analyze_resumes(texts):
+    """Analyzes a batch of resume texts, returning one analyze_resume result per text."""
+    if len(texts) < PARALLEL_RESUME_THRESHOLD:
+        return [analyze_resume(text) for text in texts]
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(analyze_resume, texts, chunksize=RESUME_CHUNK_SIZE))
+
 def save_visualizations(entities, strengths, weaknesses, best_profile, profile_scores, output_dir):
-    """Saves visualizations as images."""
-    # Skills visualization for detected profile
-    skills_count = Counter(entities["skills"])
-    
-    if skills_count:
-        skills, counts = zip(*skills_count.items())
-        plt.figure(figsize=(10, 5))
-        sns.barplot(x=list(skills), y=list(counts), palette="viridis")
-        plt.title("Skills Mentioned in Resume")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, "skills_visualization.png"))
-        plt.close()
-    else:
+    """Saves visualizations as a single image with one panel per chart.
+
+    Returns the image path, or None when there was nothing to draw.
+    """
+    # Without skills every chart would be empty, so don't set up matplotlib at all
+    if not strengths["skills"]:
         print("No skills found to visualize.")
+        return None
 
-    # Visualize profile match
-    if any(profile_scores.values()):
-        plt.figure(figsize=(10, 5))
-        sns.barplot(x=list(profile_scores.keys()), y=list(profile_scores.values()), palette="coolwarm")
-        plt.title("Profile Match Based on Skills")
-        plt.xticks(rotation=45)
-        plt.xlabel("Job Profiles")
-        plt.ylabel("Matching Skill Count")
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, "profile_match_visualization.png"))
-        plt.close()
-    else:
-        print("No profile matches found for visualization.")
+    image_path = os.path.join(output_dir, "resume_analysis_visualization.png")
+    stamp_path = image_path + ".sha1"
+
+    # Skip rendering when the image on disk was drawn from the same inputs
+    key = hashlib.sha1(repr((
+        CHART_VERSION,
+        sorted(entities["skills"]),
+        list(profile_scores.items()),
+        len(weaknesses["missing_skills"]),
+        len(strengths["skills"]),
+        best_profile,
+    )).encode()).hexdigest()
+    if os.path.exists(image_path) and os.path.exists(stamp_path):
+        with open(stamp_path) as stamp_file:
+            if stamp_file.read() == key:
+                return image_path
+
+    # Imported lazily, so callers that only analyze text don't pay for matplotlib.
+    # A bare Figure renders straight to file without pyplot, so the importing
+    # process's backend is never touched.
+    from matplotlib import colormaps
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 15))
+    skills_ax, profile_ax, analysis_ax = fig.subplots(3, 1)
+
+    # Skills visualization for detected profile
+    # Skills are deduplicated during extraction, so each one is mentioned once
+    skills = sorted(entities["skills"])
+    counts = [1] * len(skills)
+    skills_ax.bar(skills, counts, color=colormaps["viridis"](np.linspace(0, 1, len(skills))))
+    skills_ax.set_title("Skills Mentioned in Resume")
+    skills_ax.tick_params(axis="x", labelrotation=45)
+
+    # Visualize profile match (every skill belongs to a profile, so some score is non-zero)
+    profile_ax.bar(list(profile_scores.keys()), list(profile_scores.values()), color=colormaps["coolwarm"](np.linspace(0, 1, len(profile_scores))))
+    profile_ax.set_title("Profile Match Based on Skills")
+    profile_ax.tick_params(axis="x", labelrotation=45)
+    profile_ax.set_xlabel("Job Profiles")
+    profile_ax.set_ylabel("Matching Skill Count")
 
     # Missing skills for best-fit profile
     missing_skills_count = len(weaknesses["missing_skills"])
-    if missing_skills_count > 0 or strengths["skills"]:
-        plt.figure(figsize=(5, 5))
-        plt.pie([missing_skills_count, len(strengths["skills"])], labels=['Missing Skills', 'Present Skills'], autopct='%1.1f%%', startangle=90)
-        plt.title(f"Skills Analysis for Best Profile: {best_profile}")
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, "skills_analysis_visualization.png"))
-        plt.close()
-    else:
-        print("No missing or present skills found for visualization.")
+    analysis_ax.pie([missing_skills_count, len(strengths["skills"])], labels=['Missing Skills', 'Present Skills'], autopct='%1.1f%%', startangle=90)
+    analysis_ax.set_title(f"Skills Analysis for Best Profile: {best_profile}")
+
+    fig.tight_layout()
+    # 72 DPI is still above the resolution the chart is embedded at in the report
+    fig.savefig(image_path, dpi=72, pil_kwargs={"optimize": True})
+    with open(stamp_path, "w") as stamp_file:
+        stamp_file.write(key)
+    return image_path
+
+def generate_report(entities, strengths, weaknesses, best_profile, profile_scores, output_dir, visualization_path=None):
+    """Generates a report summarizing the candidate's resume analysis.
+
+    The chart image from save_visualizations is embedded when visualization_path is given.
+    """
+    # Imported lazily, so callers that only analyze text don't pay for reportlab
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.units import inch
+    from reportlab.lib.utils import ImageReader
 
-def generate_report(entities, strengths, weaknesses, best_profile, profile_scores, output_dir):
-    """Generates a report summarizing the candidate's resume analysis."""
     report_path = os.path.join(output_dir, "resume_analysis_report.pdf")
-    c = canvas.Canvas(report_path, pagesize=letter)
+    if visualization_path:
+        visualization = ImageReader(visualization_path)
+
+    # Build the PDF in memory and write it to disk in one go
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=letter)
 
-    def add_text_with_new_page(text, y_position):
-        """Add text to canvas and handle new page if needed."""
-        for line in text.split('\n'):
+    def add_lines_with_new_page(lines, y_position):
+        """Add lines to canvas as one text object per page and handle new page if needed."""
+        text = c.beginText(1 * inch, y_position)
+        text.setLeading(0.2 * inch)
+        for line in lines:
             if y_position < 1 * inch:
+                c.drawText(text)  # Flush the lines collected for this page
                 c.showPage()  # Create a new page
                 y_position = 10 * inch  # Reset y position for the new page
-            c.drawString(1 * inch, y_position, line)
+                text = c.beginText(1 * inch, y_position)
+                text.setLeading(0.2 * inch)
+            text.textLine(line)
             y_position -= 0.2 * inch
+        c.drawText(text)
         return y_position
 
     # Report Header
@@ -160,83 +292,95 @@ def generate_report(entities, strengths, weaknesses, best_profile, profile_score
     c.drawString(1 * inch, y_position, f"Suggested Job Profile: {best_profile}")
     y_position -= 0.5 * inch
 
-    # Strengths
-    y_position = add_text_with_new_page("Strengths:", y_position)
-    y_position = add_text_with_new_page(f"- Skills Mentioned: {', '.join(strengths['skills']) if strengths['skills'] else 'None found'}", y_position)
-    y_position = add_text_with_new_page(f"- Education Level: {strengths['education_level'] or 'Not specified'}", y_position)
-
-    # Weaknesses
-    y_position = add_text_with_new_page("Weaknesses:", y_position)
-    y_position = add_text_with_new_page(f"- Missing Skills for {best_profile} Profile: {', '.join(weaknesses['missing_skills']) if weaknesses['missing_skills'] else 'None'}", y_position)
-
-    # Profile Scores
-    y_position = add_text_with_new_page("Profile Scores (Skill Matches):", y_position)
-    for profile, score in profile_scores.items():
-        y_position = add_text_with_new_page(f"- {profile}: {score} matching skills", y_position)
-
-    # Recommendations
-    y_position = add_text_with_new_page("Recommendations:", y_position)
+    # Report body, assembled once and drawn in a single pass
     if weaknesses["missing_skills"]:
-        y_position = add_text_with_new_page(f"- To improve your profile as a {best_profile}, consider gaining skills in: ", y_position)
-        y_position = add_text_with_new_page(f"{', '.join(weaknesses['missing_skills'])}.", y_position)
+        recommendations = [
+            f"- To improve your profile as a {best_profile}, consider gaining skills in: ",
+            f"{', '.join(weaknesses['missing_skills'])}.",
+        ]
     else:
-        y_position = add_text_with_new_page("- No additional skills are missing for your suggested profile!", y_position)
+        recommendations = ["- No additional skills are missing for your suggested profile!"]
 
-    y_position = add_text_with_new_page("- Continue building expertise in areas related to your suggested profile to improve competitiveness.", y_position)
+    report_lines = [
+        # Strengths
+        "Strengths:",
+        f"- Skills Mentioned: {', '.join(strengths['skills']) if strengths['skills'] else 'None found'}",
+        f"- Education Level: {strengths['education_level'] or 'Not specified'}",
+        # Weaknesses
+        "Weaknesses:",
+        f"- Missing Skills for {best_profile} Profile: {', '.join(weaknesses['missing_skills']) if weaknesses['missing_skills'] else 'None'}",
+        # Profile Scores
+        "Profile Scores (Skill Matches):",
+        *[f"- {profile}: {score} matching skills" for profile, score in profile_scores.items()],
+        # Recommendations
+        "Recommendations:",
+        *recommendations,
+        "- Continue building expertise in areas related to your suggested profile to improve competitiveness.",
+    ]
+    add_lines_with_new_page(report_lines, y_position)
 
     # Add visualizations to the report after the text
-    c.showPage()  # Start a new page for graphs
-    c.drawString(1 * inch, 10 * inch, "Visualizations")
-    y_position = 9.5 * inch
-
-    # Skills Visualization
-    c.drawImage(os.path.join(output_dir, "skills_visualization.png"), 1 * inch, y_position - 2 * inch, width=5 * inch, height=2.5 * inch)
-    y_position -= 2.8 * inch  # Adjust position for next image
-    if y_position < 1 * inch:  # Check if we need a new page
-        c.showPage()
-        y_position = 10 * inch
-    c.drawString(1 * inch, y_position, "Skills Visualization")
-    y_position -= 0.5 * inch
-
-    # Profile Match Visualization
-    c.drawImage(os.path.join(output_dir, "profile_match_visualization.png"), 1 * inch, y_position - 2 * inch, width=5 * inch, height=2.5 * inch)
-    y_position -= 2.8 * inch  # Adjust position for next image
-    if y_position < 1 * inch:  # Check if we need a new page
-        c.showPage()
-        y_position = 10 * inch
-    c.drawString(1 * inch, y_position, "Profile Match Visualization")
-    y_position -= 0.5 * inch
+    if visualization_path:
+        c.showPage()  # Start a new page for graphs
+        c.drawString(1 * inch, 10 * inch, "Visualizations")
 
-    # Skills Analysis Visualization
-    c.drawImage(os.path.join(output_dir, "skills_analysis_visualization.png"), 1 * inch, y_position - 2 * inch, width=5 * inch, height=2.5 * inch)
+        # Skills, profile match and skills analysis charts, stacked top to bottom
+        c.drawImage(visualization, 1.5 * inch, 1.25 * inch, width=5.5 * inch, height=8.25 * inch)
 
     c.save()
+    with open(report_path, "wb") as report_file:
+        report_file.write(buffer.getvalue())
     print(f"Report generated at: {report_path}")
 
 
 
+@memory.cache
+def cached_analysis(pdf_path, mtime, analysis_version):
+    """Extracts and analyzes a resume PDF; results are cached on disk per (path, mtime, analysis version)."""
+    text = extract_text_from_pdf(pdf_path)
+    return analyze_resume(text)
+
+def analyze_pdf(pdf_path):
+    """Extracts and analyzes a single resume PDF, reusing cached results while the file is unchanged."""
+    pdf_path = os.path.abspath(pdf_path)
+    return cached_analysis(pdf_path, os.path.getmtime(pdf_path), ANALYSIS_VERSION)
+
 # Main Function
-def main(pdf_path):
+def main(pdf_paths):
     output_dir = "resume_analysis_output"
     os.makedirs(output_dir, exist_ok=True)
     
-    # Extract and analyze resume text
-    text = extract_text_from_pdf(pdf_path)
-    entities, strengths, weaknesses, best_profile, profile_scores = analyze_resume(text)
-    
-    # Print analysis
-    print("\nEntities Extracted:\n", entities)
-    print("\nStrengths:\n", strengths)
-    print("\nWeaknesses:\n", weaknesses)
-    print("\nSuggested Job Profile:\n", best_profile)
-    print("\nProfile Scores:\n", profile_scores)
-    
-    # Save visualizations
-    save_visualizations(entities, strengths, weaknesses, best_profile, profile_scores, output_dir)
+    # Extract and analyze resume texts, spreading large batches across worker processes
+    if len(pdf_paths) >= PARALLEL_RESUME_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(analyze_pdf, pdf_paths, chunksize=RESUME_CHUNK_SIZE))
+    else:
+        results = [analyze_pdf(pdf_path) for pdf_path in pdf_paths]
     
-    # Generate report
-    generate_report(entities, strengths, weaknesses, best_profile, profile_scores, output_dir)
+    for index, (pdf_path, (entities, strengths, weaknesses, best_profile, profile_scores)) in enumerate(zip(pdf_paths, results), start=1):
+        # Keep each resume's outputs apart when screening a batch; the index keeps
+        # same-named files from different directories from overwriting each other
+        resume_dir = output_dir
+        if len(pdf_paths) > 1:
+            stem = os.path.splitext(os.path.basename(pdf_path))[0]
+            resume_dir = os.path.join(output_dir, f"{index}_{stem}")
+            os.makedirs(resume_dir, exist_ok=True)
+        
+        # Print analysis
+        print(f"\nResume: {pdf_path}")
+        print("\nEntities Extracted:\n", entities)
+        print("\nStrengths:\n", strengths)
+        print("\nWeaknesses:\n", weaknesses)
+        print("\nSuggested Job Profile:\n", best_profile)
+        print("\nProfile Scores:\n", profile_scores)
+        
+        # Save visualizations
+        visualization_path = save_visualizations(entities, strengths, weaknesses, best_profile, profile_scores, resume_dir)
+        
+        # Generate report
+        generate_report(entities, strengths, weaknesses, best_profile, profile_scores, resume_dir, visualization_path)
 
-# Run the model on a sample PDF resume
-pdf_path = "C:\\Users\\krish\\Desktop\\Resume ai\\Krishn-Sharma_resume.pdf"  # Path to resume PDF
-main(pdf_path)
+# Run the model on the PDF resumes given on the command line, or on the sample resume
+if __name__ == "__main__":
+    pdf_path = "C:\\Users\\krish\\Desktop\\Resume ai\\Krishn-Sharma_resume.pdf"  # Path to resume PDF
+    main(sys.argv[1:] or [pdf_path])